@@ -33,21 +33,21 @@ async def main():
         user_id = account["user_id"]
         print(f"✅ Account created: {user_id}")
 
-        # 2. Link payment rail
-        print("\nLinking payment rail...")
-        await client.accounts.link_rail(user_id, rail_name="BDK")
-        print("✅ Rail linked")
-
-        # 3. Create beneficiary
-        print("\nCreating beneficiary...")
-        beneficiary = await client.beneficiaries.create(
-            user_id=user_id,
-            name="Jane Smith",
-            iban="FR1420041010050500013M02606",
-            currency="EUR",
-            bank_name="Test Bank",
-            address="456 Test Ave",
+        # 2-3. Link payment rail and create beneficiary
+        # (both only need user_id, so they run concurrently)
+        print("\nLinking payment rail and creating beneficiary...")
+        _, beneficiary = await asyncio.gather(
+            client.accounts.link_rail(user_id, rail_name="BDK"),
+            client.beneficiaries.create(
+                user_id=user_id,
+                name="Jane Smith",
+                iban="FR1420041010050500013M02606",
+                currency="EUR",
+                bank_name="Test Bank",
+                address="456 Test Ave",
+            ),
         )
+        print("✅ Rail linked")
         print(f"✅ Beneficiary created: {beneficiary['name']}")
 
         # 4. Send payment
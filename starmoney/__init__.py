@@ -21,6 +21,14 @@ Quick Start:
         status = await client.payments.get_status(...)
     ```
 
+Synchronous Usage:
+    ```python
+    from starmoney import SyncStarmoneyClient
+
+    with SyncStarmoneyClient(jwt_secret="your-secret", issuer="your-service") as client:
+        account = client.accounts.create(...)
+    ```
+
 Webhook Validation:
     ```python
     from starmoney.webhooks import WebhookValidator
@@ -30,23 +38,28 @@ Webhook Validation:
     ```
 """
 
-from .client import StarmoneyClient
-from .webhooks.validator import WebhookValidator
-from .exceptions import (
-    StarmoneyError,
-    APIError,
-    AuthenticationError,
-    ValidationError,
-    PaymentNotFoundError,
-    DuplicateResourceError,
-    RateLimitError,
-    ServerError,
-    InvalidSignatureError,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import StarmoneyClient
+    from .sync import SyncStarmoneyClient
+    from .webhooks.validator import WebhookValidator
+    from .exceptions import (
+        StarmoneyError,
+        APIError,
+        AuthenticationError,
+        ValidationError,
+        PaymentNotFoundError,
+        DuplicateResourceError,
+        RateLimitError,
+        ServerError,
+        InvalidSignatureError,
+    )
 
 __version__ = "0.1.0"
 __all__ = [
     "StarmoneyClient",
+    "SyncStarmoneyClient",
     "WebhookValidator",
     "StarmoneyError",
     "APIError",
@@ -58,3 +71,37 @@ __all__ = [
     "ServerError",
     "InvalidSignatureError",
 ]
+
+# Public names are imported on first access (PEP 562) so that, e.g., a webhook
+# receiver importing WebhookValidator never loads httpx and the API client.
+_LAZY_IMPORTS = {
+    "StarmoneyClient": ".client",
+    "SyncStarmoneyClient": ".sync",
+    "WebhookValidator": ".webhooks.validator",
+    "StarmoneyError": ".exceptions",
+    "APIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "PaymentNotFoundError": ".exceptions",
+    "DuplicateResourceError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "ServerError": ".exceptions",
+    "InvalidSignatureError": ".exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,9 +5,19 @@ Handles JWT token generation for service-to-service and user authentication.
 Matches the authentication pattern from the StarMoney Bank Service.
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-from jose import jwt
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by RFC 7515."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
 
 
 class AuthManager:
@@ -17,8 +27,20 @@ class AuthManager:
     Supports two authentication modes:
     1. Service tokens (iss claim only) - for service-to-service calls
     2. User tokens (sub + iss claims) - for user-scoped operations
+
+    Signed tokens are cached per subject (None for the service token, user_id
+    for user tokens) and reused until shortly before they expire, so the
+    signing cost is paid once per token lifetime rather than once per request.
+    Each entry also holds the ready-made Authorization header for the token.
+    The cache keeps the most recently used MAX_CACHED_TOKENS subjects.
     """
 
+    # Refresh cached tokens this many seconds before their `exp` claim
+    TOKEN_REFRESH_MARGIN = 60
+    MAX_CACHED_TOKENS = 1024
+    # Only HS256 is supported, so the JOSE header is the same for every token
+    _ALGORITHM = "HS256"
+
     def __init__(self, jwt_secret: str, issuer: str = "starmoney-sdk"):
         """
         Initialize authentication manager.
@@ -29,8 +51,49 @@ class AuthManager:
         """
         self.jwt_secret = jwt_secret
         self.issuer = issuer
-        self.algorithm = "HS256"
+        # Lifetime of newly signed tokens; read on every signing
         self.token_expiry_hours = 1
+        # Static claims shared by every token this manager signs
+        self._base_payload: dict[str, Any] = {"iss": issuer}
+        self._header_b64 = _b64url(
+            json.dumps({"alg": self._ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode("utf-8")
+        )
+        # Keyed HMAC state (pads derived once); copied for each signature
+        self._hmac_template = hmac.new(jwt_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        # subject -> (token, read-only Authorization header, exp)
+        self._token_cache: OrderedDict[Optional[str], tuple[str, Mapping[str, str], int]] = OrderedDict()
+
+    def _get_entry(self, subject: Optional[str]) -> tuple[str, Mapping[str, str], int]:
+        """Return the cache entry for subject, signing a new token if it is missing or about to expire."""
+        entry = self._token_cache.get(subject)
+        if entry is not None:
+            if entry[2] - time.time() > self.TOKEN_REFRESH_MARGIN:
+                self._token_cache.move_to_end(subject)
+                return entry
+            del self._token_cache[subject]
+        return self._sign(subject)
+
+    def _sign(self, subject: Optional[str]) -> tuple[str, Mapping[str, str], int]:
+        """Sign a fresh token for subject and store it in the cache."""
+        now = int(time.time())
+        expires_at = now + int(self.token_expiry_hours * 3600)
+        payload = {**self._base_payload, "iat": now, "exp": expires_at}
+        if subject is not None:
+            payload["sub"] = subject
+
+        payload_json = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        signing_input = self._header_b64 + b"." + _b64url(payload_json)
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+        token = (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+        auth_header = MappingProxyType({"Authorization": "Bearer " + token})
+        entry = (token, auth_header, expires_at)
+        self._token_cache[subject] = entry
+        if len(self._token_cache) > self.MAX_CACHED_TOKENS:
+            self._token_cache.popitem(last=False)
+        return entry
 
     def create_service_token(self) -> str:
         """
@@ -44,12 +107,7 @@ class AuthManager:
         Returns:
             Signed JWT token string
         """
-        payload = {
-            "iss": self.issuer,
-            "exp": datetime.now(timezone.utc) + timedelta(hours=self.token_expiry_hours),
-            "iat": datetime.now(timezone.utc),
-        }
-        return jwt.encode(payload, self.jwt_secret, algorithm=self.algorithm)
+        return self._get_entry(None)[0]
 
     def create_user_token(self, user_id: str) -> str:
         """
@@ -66,28 +124,20 @@ class AuthManager:
         Returns:
             Signed JWT token string
         """
-        payload = {
-            "sub": user_id,
-            "iss": self.issuer,
-            "exp": datetime.now(timezone.utc) + timedelta(hours=self.token_expiry_hours),
-            "iat": datetime.now(timezone.utc),
-        }
-        return jwt.encode(payload, self.jwt_secret, algorithm=self.algorithm)
-
-    def get_auth_header(self, user_id: Optional[str] = None) -> dict[str, str]:
+        return self._get_entry(user_id)[0]
+
+    def get_auth_header(self, user_id: Optional[str] = None) -> Mapping[str, str]:
         """
         Get HTTP authorization header for API requests.
 
+        The mapping is shared with the token cache and is read-only; copy it
+        before adding other headers.
+
         Args:
             user_id: Optional user ID for user-scoped operations.
                     If None, creates service-level token.
 
         Returns:
-            Dictionary with Authorization header
+            Read-only mapping with the Authorization header
         """
-        if user_id:
-            token = self.create_user_token(user_id)
-        else:
-            token = self.create_service_token()
-
-        return {"Authorization": f"Bearer {token}"}
+        return self._get_entry(user_id or None)[1]
@@ -4,10 +4,10 @@ StarMoney Python SDK - Main Client
 Official async Python client for StarMoney Bank API.
 """
 
-from typing import Optional
+import httpx
 
 from .auth import AuthManager
-from .http_client import HTTPClient
+from .http_client import DEFAULT_LIMITS, HTTPClient
 from .resources.accounts import AccountsResource
 from .resources.beneficiaries import BeneficiariesResource
 from .resources.payments import PaymentsResource
@@ -24,6 +24,9 @@ class StarmoneyClient:
     - Payments: Send payments, check status
     - Webhooks: Subscribe to payment events
 
+    The client must be used as an async context manager (or opened with
+    connect() and released with close()) before making requests.
+
     Example:
         ```python
         from starmoney import StarmoneyClient
@@ -70,12 +73,31 @@ class StarmoneyClient:
         ```
     """
 
+    __slots__ = (
+        "jwt_secret",
+        "issuer",
+        "base_url",
+        "timeout",
+        "max_retries",
+        "http2",
+        "limits",
+        "_auth",
+        "_http_client",
+        "accounts",
+        "beneficiaries",
+        "payments",
+        "webhooks",
+    )
+
     def __init__(
         self,
         jwt_secret: str,
         issuer: str = "starmoney-sdk",
         base_url: str = "http://localhost:8000/starmoney/v1",
         timeout: int = 30,
+        max_retries: int = 3,
+        http2: bool = True,
+        limits: httpx.Limits = DEFAULT_LIMITS,
     ):
         """
         Initialize StarMoney API client.
@@ -89,51 +111,45 @@ class StarmoneyClient:
                      Default: http://localhost:8000/starmoney/v1 (local dev)
                      Production: https://api.starmoney.com/v1
             timeout: Request timeout in seconds (default: 30)
+            max_retries: Retries for rate-limited (429) and gateway error
+                        (502/503/504) responses (default: 3, 0 disables).
+                        Gateway errors on POST requests are not retried,
+                        since the server may already have processed them
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+                  (default: True; falls back to HTTP/1.1 if the server lacks it)
+            limits: Connection pool limits (default: 100 connections,
+                   50 keep-alive, 30s keep-alive expiry)
         """
         self.jwt_secret = jwt_secret
         self.issuer = issuer
         self.base_url = base_url
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.http2 = http2
+        self.limits = limits
 
         # Initialize auth manager
         self._auth = AuthManager(jwt_secret=jwt_secret, issuer=issuer)
 
         # Initialize HTTP client
-        self._http_client = HTTPClient(base_url=base_url, auth=self._auth, timeout=timeout)
-
-        # Initialize resources
-        self._accounts: Optional[AccountsResource] = None
-        self._beneficiaries: Optional[BeneficiariesResource] = None
-        self._payments: Optional[PaymentsResource] = None
-        self._webhooks: Optional[WebhooksResource] = None
-
-    @property
-    def accounts(self) -> AccountsResource:
-        """Access accounts resource."""
-        if self._accounts is None:
-            self._accounts = AccountsResource(self._http_client)
-        return self._accounts
-
-    @property
-    def beneficiaries(self) -> BeneficiariesResource:
-        """Access beneficiaries resource."""
-        if self._beneficiaries is None:
-            self._beneficiaries = BeneficiariesResource(self._http_client)
-        return self._beneficiaries
-
-    @property
-    def payments(self) -> PaymentsResource:
-        """Access payments resource."""
-        if self._payments is None:
-            self._payments = PaymentsResource(self._http_client)
-        return self._payments
-
-    @property
-    def webhooks(self) -> WebhooksResource:
-        """Access webhooks resource."""
-        if self._webhooks is None:
-            self._webhooks = WebhooksResource(self._http_client)
-        return self._webhooks
+        self._http_client = HTTPClient(
+            base_url=base_url,
+            auth=self._auth,
+            timeout=timeout,
+            http2=http2,
+            limits=limits,
+            max_retries=max_retries,
+        )
+
+        # Initialize resources (cheap wrappers around the shared HTTP client)
+        self.accounts = AccountsResource(self._http_client)
+        self.beneficiaries = BeneficiariesResource(self._http_client)
+        self.payments = PaymentsResource(self._http_client)
+        self.webhooks = WebhooksResource(self._http_client)
+
+    async def connect(self) -> None:
+        """Open the connection pool without using the async context manager."""
+        await self._http_client.connect()
 
     async def __aenter__(self) -> "StarmoneyClient":
         """Async context manager entry."""
@@ -147,3 +163,7 @@ class StarmoneyClient:
     async def close(self) -> None:
         """Close the client and release resources."""
         await self._http_client.close()
+
+    async def aclose(self) -> None:
+        """Alias of close(), matching httpx.AsyncClient naming."""
+        await self.close()
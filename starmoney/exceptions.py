@@ -19,6 +19,8 @@ class APIError(StarmoneyError):
         response_data: Full response data from API
     """
 
+    __slots__ = ("status_code", "message", "response_data")
+
     def __init__(
         self, status_code: int, message: str, response_data: Optional[dict[str, Any]] = None
     ):
@@ -31,37 +33,37 @@ class APIError(StarmoneyError):
 class AuthenticationError(APIError):
     """401 - Invalid or expired authentication credentials."""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(APIError):
     """400 - Invalid request data or parameters."""
 
-    pass
+    __slots__ = ()
 
 
 class PaymentNotFoundError(APIError):
     """404 - Payment not found."""
 
-    pass
+    __slots__ = ()
 
 
 class DuplicateResourceError(APIError):
     """409 - Resource already exists (e.g., duplicate payment)."""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(APIError):
     """429 - Too many requests."""
 
-    pass
+    __slots__ = ()
 
 
 class ServerError(APIError):
     """500+ - Internal server error."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidSignatureError(StarmoneyError):
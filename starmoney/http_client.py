@@ -5,9 +5,15 @@ Async HTTP client wrapper for StarMoney API with automatic authentication,
 error handling, and correlation ID generation.
 """
 
-import uuid
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Optional
 import httpx
+import orjson
 
 from .auth import AuthManager
 from .exceptions import (
@@ -20,14 +26,69 @@ from .exceptions import (
     APIError,
 )
 
+# Status codes with a dedicated exception; other 5xx map to ServerError, the rest to APIError
+_STATUS_TO_EXC: dict[int, type[APIError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    404: PaymentNotFoundError,
+    409: DuplicateResourceError,
+    429: RateLimitError,
+}
+
+# Transient statuses retried with backoff; other errors are raised immediately
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# A gateway error may arrive after the server already acted on the request, so
+# 502/503/504 are only retried for these methods or requests carrying an
+# Idempotency-Key header. 429 means the request was not processed and is
+# always retried.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Upper bound on a single retry wait, including server-provided Retry-After values
+MAX_RETRY_DELAY = 30.0
+
+# Connection pool sizing shared by every request made through one HTTPClient
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
+# Correlation IDs are sliced from a pooled os.urandom() buffer (256 IDs per refill)
+_CORRELATION_POOL_SIZE = 16 * 256
+_correlation_pool = b""
+_correlation_pos = 0
+_correlation_lock = threading.Lock()
+
+
+def _new_correlation_id() -> str:
+    """Return a random 128-bit hex ID for the X-Correlation-ID header."""
+    global _correlation_pool, _correlation_pos
+    with _correlation_lock:
+        pos = _correlation_pos
+        if pos >= len(_correlation_pool):
+            _correlation_pool = os.urandom(_CORRELATION_POOL_SIZE)
+            pos = 0
+        _correlation_pos = pos + 16
+        chunk = _correlation_pool[pos : pos + 16]
+    return chunk.hex()
+
+
+def _reset_correlation_pool() -> None:
+    """Discard the pool in forked children so they never reuse the parent's IDs."""
+    global _correlation_pool, _correlation_pos, _correlation_lock
+    _correlation_pool = b""
+    _correlation_pos = 0
+    _correlation_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_correlation_pool)
+
 
 class HTTPClient:
     """
     Async HTTP client for StarMoney API.
 
     Handles:
+    - A single pooled HTTP/2 connection shared by all resources
     - Automatic JWT authentication
     - Correlation ID generation for tracing
+    - Retries with exponential backoff for rate limits and gateway errors
     - Error response mapping to domain exceptions
     - Request/response logging
     """
@@ -38,6 +99,10 @@ class HTTPClient:
         auth: AuthManager,
         timeout: int = 30,
         follow_redirects: bool = True,
+        http2: bool = True,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
     ):
         """
         Initialize HTTP client.
@@ -46,33 +111,45 @@ class HTTPClient:
             base_url: Base URL for StarMoney API (e.g., 'http://localhost:8000/starmoney/v1')
             auth: Authentication manager for JWT tokens
             timeout: Request timeout in seconds
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+            limits: Connection pool limits (default: DEFAULT_LIMITS)
+            max_retries: Retries for 429/502/503/504 responses (0 disables retrying)
+            retry_backoff: Base delay in seconds for exponential backoff
         """
         self.base_url = base_url.rstrip("/")
         self.auth = auth
         self.timeout = timeout
         # Follow redirects by default so SDK consumers don't get 307 responses
         self.follow_redirects = follow_redirects
+        self.http2 = http2
+        self.limits = limits
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
         self._client: Optional[httpx.AsyncClient] = None
 
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the underlying pooled httpx client."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=self.http2,
+            limits=self.limits,
+            timeout=self.timeout,
+            follow_redirects=self.follow_redirects,
+        )
+
+    async def connect(self) -> None:
+        """Open the connection pool (called by __aenter__; no-op if already open)."""
+        if self._client is None:
+            self._client = self._build_client()
+
     async def __aenter__(self) -> "HTTPClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout, follow_redirects=self.follow_redirects
-        )
+        await self.connect()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
-
-    def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout, follow_redirects=self.follow_redirects
-            )
-        return self._client
+        await self.close()
 
     def _add_headers(
         self, headers: Optional[dict[str, str]], user_id: Optional[str] = None
@@ -87,15 +164,13 @@ class HTTPClient:
         Returns:
             Combined headers with auth and correlation ID
         """
-        final_headers = headers.copy() if headers else {}
-
-        # Add authentication
+        # Add authentication (the header mapping is prebuilt and cached with the token)
         auth_header = self.auth.get_auth_header(user_id)
-        final_headers.update(auth_header)
+        final_headers = {**headers, **auth_header} if headers else dict(auth_header)
 
         # Add correlation ID for request tracing
         if "X-Correlation-ID" not in final_headers:
-            final_headers["X-Correlation-ID"] = str(uuid.uuid4())
+            final_headers["X-Correlation-ID"] = _new_correlation_id()
 
         return final_headers
 
@@ -109,28 +184,58 @@ class HTTPClient:
         Raises:
             Appropriate APIError subclass based on status code
         """
-        try:
-            error_data = response.json()
-            message = error_data.get("detail", response.text)
-        except Exception:
-            message = response.text or f"HTTP {response.status_code} error"
-            error_data = {}
+        status_code = response.status_code
+        error_data: dict[str, Any] = {}
+        message: Any = None
+
+        # Any non-empty body may be JSON (application/json, problem+json, or an
+        # unlabelled body); anything else falls back to the raw text below
+        content = response.content
+        if content:
+            try:
+                parsed = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict):
+                error_data = parsed
+                message = parsed.get("detail")
+
+        if message is None:
+            message = response.text or f"HTTP {status_code} error"
 
         # Map status codes to exceptions
-        if response.status_code == 400:
-            raise ValidationError(response.status_code, message, error_data)
-        elif response.status_code == 401:
-            raise AuthenticationError(response.status_code, message, error_data)
-        elif response.status_code == 404:
-            raise PaymentNotFoundError(response.status_code, message, error_data)
-        elif response.status_code == 409:
-            raise DuplicateResourceError(response.status_code, message, error_data)
-        elif response.status_code == 429:
-            raise RateLimitError(response.status_code, message, error_data)
-        elif response.status_code >= 500:
-            raise ServerError(response.status_code, message, error_data)
-        else:
-            raise APIError(response.status_code, message, error_data)
+        exc_class = _STATUS_TO_EXC.get(status_code) or (ServerError if status_code >= 500 else APIError)
+        raise exc_class(status_code, message, error_data)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+
+        Honors the Retry-After header (delta-seconds or HTTP-date) when present,
+        otherwise uses exponential backoff with jitter.
+
+        Args:
+            response: Retryable HTTP response
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, capped at MAX_RETRY_DELAY
+        """
+        retry_after = response.headers.get("retry-after", "").strip()
+        if retry_after:
+            # delta-seconds is a non-negative integer (RFC 9110); anything else
+            # (e.g. "nan", "-1", "1.5") is treated as an HTTP-date or ignored
+            if retry_after.isascii() and retry_after.isdigit():
+                return min(float(retry_after), MAX_RETRY_DELAY)
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                return min(max(retry_at.timestamp() - time.time(), 0.0), MAX_RETRY_DELAY)
+
+        delay = self.retry_backoff * float(2**attempt) + random.uniform(0, self.retry_backoff)
+        return min(delay, MAX_RETRY_DELAY)
 
     async def request(
         self,
@@ -143,6 +248,11 @@ class HTTPClient:
         """
         Make HTTP request to StarMoney API.
 
+        Responses with a status in RETRYABLE_STATUS_CODES are retried up to
+        max_retries times before the error is raised. 429 is always retried;
+        502/503/504 only for IDEMPOTENT_METHODS or when the request carries an
+        Idempotency-Key header, since the server may already have acted on it.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path (e.g., '/payments')
@@ -155,12 +265,35 @@ class HTTPClient:
 
         Raises:
             APIError or subclass if request fails
+            RuntimeError: If the client has not been connected
         """
-        client = self._get_client()
-        url = f"{self.base_url}{path}"
+        client = self._client
+        if client is None:
+            raise RuntimeError("HTTPClient is not connected; use 'async with' or call connect() first")
         final_headers = self._add_headers(headers, user_id)
 
-        response = await client.request(method, url, headers=final_headers, **kwargs)
+        # Serialize JSON bodies with orjson instead of httpx's stdlib encoder
+        if "json" in kwargs:
+            body = kwargs.pop("json")
+            if body is not None:
+                kwargs["content"] = orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+                final_headers["Content-Type"] = "application/json"
+
+        replay_safe = method.upper() in IDEMPOTENT_METHODS or any(
+            key.lower() == "idempotency-key" for key in final_headers
+        )
+
+        # Paths are resolved against the client's base_url
+        for attempt in range(self.max_retries + 1):
+            response = await client.request(method, path, headers=final_headers, **kwargs)
+            status_code = response.status_code
+            if (
+                status_code not in RETRYABLE_STATUS_CODES
+                or (status_code != 429 and not replay_safe)
+                or attempt == self.max_retries
+            ):
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
 
         # Raise for error status codes
         if response.status_code >= 400:
@@ -168,6 +301,11 @@ class HTTPClient:
 
         return response
 
+    @staticmethod
+    def json_response(response: httpx.Response) -> Any:
+        """Parse a response body as JSON using orjson."""
+        return orjson.loads(response.content)
+
     async def get(self, path: str, user_id: Optional[str] = None, **kwargs: Any) -> httpx.Response:
         """Make GET request."""
         return await self.request("GET", path, user_id=user_id, **kwargs)
@@ -193,3 +331,7 @@ class HTTPClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+
+    async def aclose(self) -> None:
+        """Alias of close(), matching httpx.AsyncClient naming."""
+        await self.close()
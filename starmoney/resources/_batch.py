@@ -0,0 +1,36 @@
+"""StarMoney SDK - Bounded concurrency helper for batch resource methods"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+async def gather_bounded(
+    func: Callable[..., Awaitable[Any]],
+    items: list[dict[str, Any]],
+    concurrency: int,
+) -> list[Any]:
+    """
+    Call func(**item) for every item, running at most `concurrency` calls at once.
+
+    Args:
+        func: Resource coroutine method to call for each item
+        items: Keyword arguments for each call
+        concurrency: Maximum number of in-flight requests
+
+    Returns:
+        Results in the same order as items. A failed call yields its
+        exception instead of a result, so one failure does not cancel the rest.
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: dict[str, Any]) -> Any:
+        async with semaphore:
+            return await func(**item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
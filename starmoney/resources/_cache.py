@@ -0,0 +1,50 @@
+"""StarMoney SDK - In-memory TTL cache for lookup resource methods"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small LRU cache whose entries expire after a fixed time-to-live.
+
+    Only successful responses are stored; errors (e.g. 404 lookups) are never
+    cached, so a missing record is re-checked on the next call.
+    """
+
+    __slots__ = ("ttl", "maxsize", "_entries")
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the entry for key, if any."""
+        self._entries.pop(key, None)
@@ -3,6 +3,11 @@
 from typing import Any
 from typing import Dict
 from ..http_client import HTTPClient
+from ._batch import gather_bounded
+from ._cache import TTLCache
+
+# How long lookup results are reused before hitting the API again
+LOOKUP_CACHE_TTL = 300.0
 
 
 class AccountsResource:
@@ -10,12 +15,17 @@ class AccountsResource:
     Accounts resource for user account management.
 
     Handles:
-    - Creating user accounts
+    - Creating user accounts (individually or concurrently in bulk)
     - Linking payment rails to accounts
+    - Looking up users and their rails (cached for LOOKUP_CACHE_TTL seconds)
     """
 
+    __slots__ = ("http", "_phone_cache", "_rails_cache")
+
     def __init__(self, http_client: HTTPClient):
         self.http = http_client
+        self._phone_cache = TTLCache(ttl=LOOKUP_CACHE_TTL)
+        self._rails_cache = TTLCache(ttl=LOOKUP_CACHE_TTL)
 
     async def create(
         self,
@@ -67,7 +77,32 @@ class AccountsResource:
         }
 
         response = await self.http.post("/accounts", json=payload)
-        return response.json()
+        return self.http.json_response(response)
+
+    async def create_many(
+        self, accounts: list[dict[str, Any]], concurrency: int = 10
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Create several accounts concurrently.
+
+        Args:
+            accounts: Keyword arguments for create(), one dict per account
+            concurrency: Maximum number of requests in flight (default: 10)
+
+        Returns:
+            One entry per input, in order: the account data, or the exception
+            raised for that account (e.g. DuplicateResourceError)
+
+        Example:
+            ```python
+            results = await client.accounts.create_many([
+                {"first_name": "John", "last_name": "Doe", ...},
+                {"first_name": "Jane", "last_name": "Smith", ...},
+            ])
+            user_ids = [r["user_id"] for r in results if not isinstance(r, Exception)]
+            ```
+        """
+        return await gather_bounded(self.create, accounts, concurrency)
 
     async def link_rail(self, user_id: str, rail_name: str = "BDK") -> dict[str, Any]:
         """
@@ -86,7 +121,9 @@ class AccountsResource:
             ```
         """
         response = await self.http.post(f"/accounts/rails/{rail_name}", user_id=user_id)
-        return response.json()
+        # The user's available rails changed; don't serve the old list
+        self._rails_cache.invalidate(user_id)
+        return self.http.json_response(response)
 
     async def get_transfer_history(self, user_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
@@ -102,32 +139,47 @@ class AccountsResource:
         """
         params = {"limit": limit, "offset": offset}
         response = await self.http.get("/accounts/transfers", params=params, user_id=user_id)
-        return response.json()
+        return self.http.json_response(response)
 
-    async def get_user_by_phone(self, phone_number: str) -> Dict[str, Any] | None:
+    async def get_user_by_phone(self, phone_number: str, force_refresh: bool = False) -> Dict[str, Any] | None:
         """
         Retrieve a user by phone number using the accounts lookup endpoint.
 
+        Successful lookups are cached for LOOKUP_CACHE_TTL seconds; failed
+        lookups, including 404s, are never cached. Each call returns a freshly
+        parsed dict, so callers may modify it without affecting the cache.
+
         Args:
             phone_number: Phone number string to lookup (should be in E.164 or service-expected format)
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
-            The parsed JSON response as a dict if found, or None if the API returns 404.
-        """
-        response = await self.http.get(f"/accounts/lookup/phone/{phone_number}")
+            The parsed JSON response as a dict
 
-        return response.json()
+        Raises:
+            PaymentNotFoundError: If the API returns 404 (no user with this number)
+        """
+        # The response (not its parsed body) is cached and re-parsed per call
+        response = None if force_refresh else self._phone_cache.get(phone_number)
+        if response is None:
+            response = await self.http.get(f"/accounts/lookup/phone/{phone_number}")
+            self._phone_cache.set(phone_number, response)
 
+        return self.http.json_response(response)
 
-    async def get_user_available_rails(self, user_id: str) -> Dict[str, Any]:
+    async def get_user_available_rails(self, user_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get available payment rails for the authenticated user.
 
         Returns the list of payment rails available to the user based on their
-        stored credentials and rail configurations.
+        stored credentials and rail configurations. Results are cached for
+        LOOKUP_CACHE_TTL seconds and invalidated by link_rail() for that user;
+        errors, including 404s, are never cached. Each call returns a freshly
+        parsed dict, so callers may modify it without affecting the cache.
 
         Args:
             user_id: User ID to retrieve available rails for
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             Parsed JSON response containing:
@@ -143,5 +195,9 @@ class AccountsResource:
                 print(f"{rail['name']}: {rail['has_credentials']}")
             ```
         """
-        response = await self.http.get("/accounts/rails", user_id=user_id)
-        return response.json()
+        response = None if force_refresh else self._rails_cache.get(user_id)
+        if response is None:
+            response = await self.http.get("/accounts/rails", user_id=user_id)
+            self._rails_cache.set(user_id, response)
+
+        return self.http.json_response(response)
@@ -13,6 +13,8 @@ class BeneficiariesResource:
     - Listing user's beneficiaries
     """
 
+    __slots__ = ("http",)
+
     def __init__(self, http_client: HTTPClient):
         self.http = http_client
 
@@ -62,7 +64,7 @@ class BeneficiariesResource:
             payload["email"] = email
 
         response = await self.http.post("/beneficiaries", json=payload, user_id=user_id)
-        return response.json()
+        return self.http.json_response(response)
 
     async def list(self, user_id: str) -> list[dict[str, Any]]:
         """
@@ -75,4 +77,4 @@ class BeneficiariesResource:
             List of beneficiary objects
         """
         response = await self.http.get("/beneficiaries", user_id=user_id)
-        return response.json()
+        return self.http.json_response(response)
@@ -1,9 +1,58 @@
 """StarMoney SDK - Payments Resource"""
 
+import asyncio
 import uuid
-from decimal import Decimal
+from collections import OrderedDict
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from typing import Any, Optional
+from ..exceptions import APIError, DuplicateResourceError
 from ..http_client import HTTPClient
+from ._batch import gather_bounded
+
+# Amounts are sent with exactly two decimal places
+_CENTS = Decimal("0.01")
+
+
+def _build_payment_payload(
+    amount: Decimal | float | str,
+    currency: str,
+    beneficiary_iban: str,
+    beneficiary_name: str,
+    description: str,
+    rail_name: str,
+    client_transaction_id: Optional[str] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Build the wire payload for one payment, as sent by send() and send_batch()."""
+    if client_transaction_id is None:
+        client_transaction_id = f"sdk-{uuid.uuid4().hex}"
+
+    # Normalize every amount type to a two-decimal string; floats go through
+    # str() so 2.675 is read as written rather than as its binary approximation
+    try:
+        value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+        amount_str = format(value.quantize(_CENTS, rounding=ROUND_HALF_UP), "f")
+    except InvalidOperation:
+        raise ValueError(f"Invalid payment amount: {amount!r}") from None
+    if not value.is_finite():
+        raise ValueError(f"Invalid payment amount: {amount!r}")
+
+    return {
+        "amount": amount_str,
+        "currency": currency,
+        "beneficiary_iban": beneficiary_iban,
+        "beneficiary_name": beneficiary_name,
+        "description": description,
+        "rail_name": rail_name,
+        "client_transaction_id": client_transaction_id,
+        "metadata": metadata,
+    }
+
+
+def _is_missing_route(error: APIError) -> bool:
+    """Whether an error means the endpoint itself does not exist on this API."""
+    # A route miss gets the framework's bare 404 detail; domain 404s explain what is missing
+    return error.status_code == 405 or (error.status_code == 404 and error.message == "Not Found")
 
 
 class PaymentsResource:
@@ -11,12 +60,65 @@ class PaymentsResource:
     Payments resource for sending and tracking payments.
 
     Handles:
-    - Sending payments with automatic idempotency
+    - Sending payments with automatic idempotency (individually or concurrently in bulk)
+    - Sending a user's payments in one batch request
     - Checking payment status
+
+    Caller-supplied client_transaction_ids that send() or send_batch() has seen
+    succeed (or that the API reported as duplicates) are remembered per user,
+    up to the most recent MAX_TRACKED_TRANSACTION_IDS. Resending one from the
+    same client through either method raises DuplicateResourceError locally
+    instead of waiting for the API's 409. A resend while the first send is
+    still in flight waits for its outcome. It raises only if that send
+    succeeded; otherwise it is sent normally.
     """
 
+    MAX_TRACKED_TRANSACTION_IDS = 10_000
+
+    __slots__ = ("http", "_batch_supported", "_sent_ids", "_inflight")
+
     def __init__(self, http_client: HTTPClient):
         self.http = http_client
+        # Cleared once the API reports it has no batch endpoint
+        self._batch_supported = True
+        # Insertion-ordered set of confirmed (user_id, client_transaction_id) pairs
+        self._sent_ids: OrderedDict[tuple[str, str], None] = OrderedDict()
+        # (user_id, client_transaction_id) -> set once its send()/send_batch() finishes
+        self._inflight: dict[tuple[str, str], asyncio.Event] = {}
+
+    def _remember(self, key: tuple[str, str]) -> None:
+        """Record a confirmed payment, dropping the oldest record if full."""
+        self._sent_ids[key] = None
+        if len(self._sent_ids) > self.MAX_TRACKED_TRANSACTION_IDS:
+            self._sent_ids.popitem(last=False)
+
+    async def _claim(self, keys: list[tuple[str, str]]) -> None:
+        """
+        Mark payments as in flight before sending them.
+
+        Waits for other in-flight sends of the same keys, whose outcome decides
+        these ones, then rejects keys already confirmed as sent.
+
+        Raises:
+            DuplicateResourceError: If a key was already sent successfully
+        """
+        while True:
+            pending = next((self._inflight[key] for key in keys if key in self._inflight), None)
+            if pending is None:
+                break
+            await pending.wait()
+
+        for key in keys:
+            if key in self._sent_ids:
+                raise DuplicateResourceError(409, f"Payment {key[1]!r} was already sent by this client")
+        for key in keys:
+            self._inflight[key] = asyncio.Event()
+
+    def _release(self, keys: list[tuple[str, str]]) -> None:
+        """Clear the in-flight marks set by _claim() and wake any waiting resends."""
+        # Failed sends are not recorded, so the same IDs can be retried
+        for key in keys:
+            self._inflight.pop(key).set()
 
     async def send(
         self,
@@ -27,7 +129,7 @@ class PaymentsResource:
         beneficiary_name: str,
         description: str,
         rail_name: str,
-        client_transaction_id: str,
+        client_transaction_id: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
         ) -> dict[str, Any]:
         """
@@ -35,18 +137,26 @@ class PaymentsResource:
 
         Args:
             user_id: User ID sending the payment
-            amount: Payment amount (Decimal, float, or string)
+            amount: Payment amount (Decimal, float, or string), sent rounded
+                    to two decimal places (e.g. 100 -> "100.00")
             currency: Currency code (e.g., 'EUR', 'USD')
             beneficiary_iban: Recipient's IBAN
             beneficiary_name: Recipient's name
             description: Payment description
             rail_name: Payment rail to use
             client_transaction_id: Idempotency key. If not provided,
-                                   a UUID will be automatically generated.
+                                   "sdk-<uuid hex>" is generated automatically.
+            metadata: Optional free-form data stored with the payment
 
         Returns:
             Payment data including transaction_id and client_transaction_id
 
+        Raises:
+            ValueError: If amount is not a finite number
+            DuplicateResourceError: If this user's client_transaction_id was already
+                                    sent successfully by this client (raised
+                                    without a request)
+
         Example:
             ```python
             payment = await client.payments.send(
@@ -64,27 +174,139 @@ class PaymentsResource:
             client_txn_id = payment["client_transaction_id"]
             ```
         """
-        # Convert amount to string for API
-        if isinstance(amount, Decimal):
-            amount_str = str(amount)
-        elif isinstance(amount, float):
-            amount_str = f"{amount:.2f}"
+        payload = _build_payment_payload(
+            amount,
+            currency,
+            beneficiary_iban,
+            beneficiary_name,
+            description,
+            rail_name,
+            client_transaction_id,
+            metadata,
+        )
+
+        # Generated IDs are unique, so only caller-supplied ones need tracking
+        if client_transaction_id is None:
+            response = await self.http.post("/payments", json=payload, user_id=user_id)
+            return self.http.json_response(response)
+
+        keys = [(user_id, client_transaction_id)]
+        await self._claim(keys)
+        try:
+            response = await self.http.post("/payments", json=payload, user_id=user_id)
+        except DuplicateResourceError:
+            self._remember(keys[0])
+            raise
         else:
-            amount_str = str(amount)
-
-        payload = {
-            "amount": amount_str,
-            "currency": currency,
-            "beneficiary_iban": beneficiary_iban,
-            "beneficiary_name": beneficiary_name,
-            "description": description,
-            "rail_name": rail_name,
-            "client_transaction_id": client_transaction_id,
-            "metadata": metadata,
-        }
-
-        response = await self.http.post("/payments", json=payload, user_id=user_id)
-        return response.json()
+            self._remember(keys[0])
+        finally:
+            self._release(keys)
+        return self.http.json_response(response)
+
+    async def send_many(
+        self, payments: list[dict[str, Any]], concurrency: int = 10
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Send several payments concurrently.
+
+        Each payment keeps its own client_transaction_id, so individual
+        failures can be retried safely.
+
+        Args:
+            payments: Keyword arguments for send(), one dict per payment
+            concurrency: Maximum number of requests in flight (default: 10)
+
+        Returns:
+            One entry per input, in order: the payment data, or the exception
+            raised for that payment
+
+        Example:
+            ```python
+            results = await client.payments.send_many([
+                {"user_id": user_id, "amount": "10.00", "client_transaction_id": "order-1", ...},
+                {"user_id": user_id, "amount": "25.00", "client_transaction_id": "order-2", ...},
+            ])
+            failed = [r for r in results if isinstance(r, Exception)]
+            ```
+        """
+        return await gather_bounded(self.send, payments, concurrency)
+
+    async def send_batch(
+        self, user_id: str, payments: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Send several payments for one user in a single request.
+
+        Payments are serialized exactly as send() does and posted together to
+        /payments/batch. If the API has no batch endpoint, this falls back to
+        send_many() over the shared connection pool and keeps using the
+        fallback for later calls. Only a 405, or a 404 with the framework's
+        bare "Not Found" detail (no such route), counts as a missing endpoint;
+        other errors, including domain 404s, are raised.
+
+        Args:
+            user_id: User ID sending the payments
+            payments: Keyword arguments for send() (without user_id), one dict per payment
+
+        Returns:
+            One entry per input, in order, as with send_many(). The batch
+            endpoint answers with the created payments either as a list or
+            under a "payments" key, so its entries are always dicts; the
+            fallback may also contain the exception raised for a payment
+
+        Raises:
+            DuplicateResourceError: If a caller-supplied client_transaction_id
+                                    was already sent by this client for this
+                                    user (raised before any request)
+            APIError: If the batch request fails, or its response does not
+                      hold one payment per input
+
+        Example:
+            ```python
+            results = await client.payments.send_batch(
+                user_id=user_id,
+                payments=[
+                    {"amount": "10.00", "client_transaction_id": "order-1", ...},
+                    {"amount": "25.00", "client_transaction_id": "order-2", ...},
+                ],
+            )
+            failed = [r for r in results if isinstance(r, Exception)]
+            ```
+        """
+        if self._batch_supported:
+            payload = {"payments": [_build_payment_payload(**payment) for payment in payments]}
+            # Same local duplicate tracking as send(); generated IDs are unique
+            keys = list(
+                dict.fromkeys(
+                    (user_id, payment["client_transaction_id"])
+                    for payment in payments
+                    if payment.get("client_transaction_id") is not None
+                )
+            )
+            await self._claim(keys)
+            try:
+                response = await self.http.post("/payments/batch", json=payload, user_id=user_id)
+            except APIError as e:
+                if not _is_missing_route(e):
+                    raise
+                self._batch_supported = False
+            else:
+                for key in keys:
+                    self._remember(key)
+                data = self.http.json_response(response)
+                created = data.get("payments") if isinstance(data, dict) else data
+                if not isinstance(created, list) or len(created) != len(payments):
+                    raise APIError(
+                        response.status_code,
+                        "Unexpected /payments/batch response: expected one payment per input",
+                        data if isinstance(data, dict) else None,
+                    )
+                return created
+            finally:
+                # Released before any fallback, whose send() calls claim the keys again
+                self._release(keys)
+
+        return await self.send_many([{**payment, "user_id": user_id} for payment in payments])
 
     async def get_status(self, user_id: str, client_transaction_id: str) -> dict[str, Any]:
         """
@@ -111,4 +333,4 @@ class PaymentsResource:
         response = await self.http.get(
             f"/payments/status/{client_transaction_id}", user_id=user_id
         )
-        return response.json()
+        return self.http.json_response(response)
@@ -10,9 +10,11 @@ class WebhooksResource:
 
     Handles:
     - Creating webhook subscriptions
-    - Batch subscribing to multiple events
+    - Batch subscribing to multiple events (batch_subscribe, subscribe_all)
     """
 
+    __slots__ = ("http",)
+
     def __init__(self, http_client: HTTPClient):
         self.http = http_client
 
@@ -63,7 +65,51 @@ class WebhooksResource:
         }
 
         response = await self.http.post("/webhook-subscriptions/batch", json=payload)
-        return response.json()
+        return self.http.json_response(response)
+
+    async def subscribe_all(
+        self,
+        endpoint_url: str,
+        webhook_secret: str,
+        event_types: list[str],
+        retry_attempts: int = 3,
+        timeout_seconds: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Subscribe one endpoint to several event types in one request.
+
+        Shorthand for batch_subscribe() when every event goes to all users,
+        instead of calling create_subscription() once per event type.
+
+        Args:
+            endpoint_url: URL where webhooks will be delivered
+            webhook_secret: Secret for HMAC signature validation
+            event_types: Event types to subscribe to (e.g., 'payment.completed')
+            retry_attempts: Number of retry attempts for failed deliveries
+            timeout_seconds: Webhook delivery timeout
+
+        Returns:
+            Subscription confirmation data
+
+        Example:
+            ```python
+            result = await client.webhooks.subscribe_all(
+                endpoint_url="https://yourapp.com/webhooks",
+                webhook_secret="your-webhook-secret",
+                event_types=["payment.initiated", "payment.completed", "payment.failed"],
+            )
+            ```
+        """
+        return await self.batch_subscribe(
+            endpoint_url=endpoint_url,
+            webhook_secret=webhook_secret,
+            event_subscriptions=[
+                {"event_type": event_type, "subscribed_users": None}
+                for event_type in event_types
+            ],
+            retry_attempts=retry_attempts,
+            timeout_seconds=timeout_seconds,
+        )
 
     async def create_subscription(
         self,
@@ -87,6 +133,10 @@ class WebhooksResource:
 
         Returns:
             Subscription data
+
+        To register several event types for one endpoint, use subscribe_all()
+        (all users) or batch_subscribe() (per-event subscribed_users), which
+        take one request instead of one per event.
         """
         payload = {
             "endpoint_url": endpoint_url,
@@ -98,7 +148,7 @@ class WebhooksResource:
         }
 
         response = await self.http.post("/webhook-subscriptions", json=payload)
-        return response.json()
+        return self.http.json_response(response)
 
     async def update_subscription(
         self,
@@ -131,26 +181,20 @@ class WebhooksResource:
         Returns:
             Updated subscription data as returned by the API
         """
-        payload: dict[str, Any] = {}
-        if endpoint_url is not None:
-            payload["endpoint_url"] = endpoint_url
-        if webhook_secret is not None:
-            payload["webhook_secret"] = webhook_secret
-        if is_active is not None:
-            payload["is_active"] = is_active
-        if event_types is not None:
-            payload["event_types"] = event_types
-        if user_filters is not None:
-            payload["user_filters"] = user_filters
-        if retry_attempts is not None:
-            payload["retry_attempts"] = retry_attempts
-        if retry_delay_seconds is not None:
-            payload["retry_delay_seconds"] = retry_delay_seconds
-        if timeout_seconds is not None:
-            payload["timeout_seconds"] = timeout_seconds
+        fields = (
+            ("endpoint_url", endpoint_url),
+            ("webhook_secret", webhook_secret),
+            ("is_active", is_active),
+            ("event_types", event_types),
+            ("user_filters", user_filters),
+            ("retry_attempts", retry_attempts),
+            ("retry_delay_seconds", retry_delay_seconds),
+            ("timeout_seconds", timeout_seconds),
+        )
+        payload: dict[str, Any] = {key: value for key, value in fields if value is not None}
 
         response = await self.http.put(f"/webhook-subscriptions/{subscription_id}", json=payload)
-        return response.json()
+        return self.http.json_response(response)
 
     async def list_subscriptions(self, active_only: bool = True) -> dict[str, Any]:
         """
@@ -164,6 +208,6 @@ class WebhooksResource:
             `subscriptions` (list) and `total_count`, but some implementations
             may return a raw list — callers should handle both shapes.
         """
-        params = {"active_only": str(active_only).lower()} if active_only is not None else {}
+        params = {"active_only": "true" if active_only else "false"} if active_only is not None else {}
         response = await self.http.get("/webhook-subscriptions", params=params)
-        return response.json()
+        return self.http.json_response(response)
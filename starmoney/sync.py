@@ -0,0 +1,126 @@
+"""
+StarMoney Python SDK - Synchronous Client
+
+Blocking facade over StarmoneyClient for scripts and other non-async code.
+"""
+
+import asyncio
+import functools
+import inspect
+import sys
+from typing import Any, Callable, Coroutine
+
+from .client import StarmoneyClient
+
+
+class _SyncResource:
+    """Proxy exposing a resource's coroutine methods as blocking calls."""
+
+    __slots__ = ("_resource", "_run")
+
+    def __init__(self, resource: Any, run: Callable[[Coroutine[Any, Any, Any]], Any]):
+        self._resource = resource
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._resource, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._run(attr(*args, **kwargs))
+
+        return call
+
+
+class SyncStarmoneyClient:
+    """
+    Synchronous StarMoney API client.
+
+    Wraps StarmoneyClient and runs every call on one event loop that lives as
+    long as the client, so the connection pool and JWT cache stay warm across
+    calls (unlike calling asyncio.run() for each operation).
+
+    Resources mirror the async client, with the same method names and
+    arguments, but return results directly.
+
+    Example:
+        ```python
+        from starmoney import SyncStarmoneyClient
+
+        with SyncStarmoneyClient(jwt_secret="your-jwt-secret", issuer="your-service-name") as client:
+            account = client.accounts.create(...)
+            client.accounts.link_rail(account["user_id"], rail_name="BDK")
+        ```
+
+    Must not be used from inside a running event loop; use StarmoneyClient there.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize synchronous client.
+
+        Args:
+            *args, **kwargs: Same arguments as StarmoneyClient
+
+        Raises:
+            RuntimeError: If called from inside a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "SyncStarmoneyClient cannot be used inside a running event loop; "
+                "use StarmoneyClient with 'async with' instead"
+            )
+
+        # Built before the event loop so a bad argument leaves nothing to close
+        self._async_client = StarmoneyClient(*args, **kwargs)
+
+        if sys.version_info >= (3, 11):
+            self._runner = asyncio.Runner()
+            self._run: Callable[[Coroutine[Any, Any, Any]], Any] = self._runner.run
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._run = self._loop.run_until_complete
+
+        self._closed = False
+        try:
+            self._run(self._async_client.connect())
+        except BaseException:
+            self._closed = True
+            self._close_loop()
+            raise
+
+        self.accounts = _SyncResource(self._async_client.accounts, self._run)
+        self.beneficiaries = _SyncResource(self._async_client.beneficiaries, self._run)
+        self.payments = _SyncResource(self._async_client.payments, self._run)
+        self.webhooks = _SyncResource(self._async_client.webhooks, self._run)
+
+    def __enter__(self) -> "SyncStarmoneyClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool and the event loop (safe to call twice)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._run(self._async_client.close())
+        finally:
+            self._close_loop()
+
+    def _close_loop(self) -> None:
+        """Close the event loop owned by this client."""
+        if sys.version_info >= (3, 11):
+            self._runner.close()
+        else:
+            self._loop.close()
@@ -5,13 +5,25 @@ CRITICAL SECURITY: Validates HMAC-SHA256 signatures on incoming webhooks.
 Must match the server implementation exactly to prevent signature bypass.
 """
 
+import binascii
 import hmac
-import hashlib
 import json
-from typing import Any
+from typing import Any, AsyncIterable
+
+import orjson
 
 from ..exceptions import InvalidSignatureError
 
+# Passing the digest by name keeps HMAC-SHA256 entirely inside OpenSSL, which
+# selects SHA-NI / ARMv8 SHA-256 instructions when the CPU has them.
+_DIGEST = "sha256"
+_SIGNATURE_PREFIX_BYTES = b"sha256="
+
+# Server's canonical JSON format, built once instead of per json.dumps() call.
+# This stays on stdlib json: orjson writes raw UTF-8 instead of \uXXXX escapes
+# and formats floats differently (1e16 vs 1e+16), so its bytes would not match.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 class WebhookValidator:
     """
@@ -21,6 +33,8 @@ class WebhookValidator:
     are authentic and haven't been tampered with.
     """
 
+    __slots__ = ("webhook_secret", "_hmac_template")
+
     def __init__(self, webhook_secret: str):
         """
         Initialize webhook validator.
@@ -30,8 +44,37 @@ class WebhookValidator:
                            (same secret used when creating webhook subscription)
         """
         self.webhook_secret = webhook_secret
+        # Keyed HMAC state (pads derived once); copied for each payload, which
+        # is faster than hmac.digest() re-keying on every call
+        self._hmac_template = hmac.new(webhook_secret.encode("utf-8"), digestmod=_DIGEST)
+
+    def _expected_signature(self, payload: bytes | bytearray | memoryview) -> bytes:
+        """Raw HMAC-SHA256 digest of a complete payload."""
+        h = self._hmac_template.copy()
+        h.update(payload)
+        return h.digest()
+
+    @staticmethod
+    def _matches(expected_signature: bytes, signature_header: str | bytes) -> bool:
+        """Compare a raw HMAC digest with the hex signature from the header."""
+        # Extract signature from header (remove "sha256=" prefix if present)
+        if isinstance(signature_header, str):
+            received_hex: str | bytes = signature_header.removeprefix("sha256=")
+        else:
+            received_hex = signature_header.removeprefix(_SIGNATURE_PREFIX_BYTES)
+        # Strict decoding for both header types: no whitespace or odd lengths.
+        # ValueError covers binascii.Error and non-ASCII str input.
+        try:
+            received_signature = binascii.unhexlify(received_hex)
+        except ValueError:
+            return False
+
+        # Constant-time comparison to prevent timing attacks
+        return hmac.compare_digest(received_signature, expected_signature)
 
-    def verify_signature(self, payload: bytes, signature_header: str) -> bool:
+    def verify_signature(
+        self, payload: bytes | bytearray | memoryview, signature_header: str
+    ) -> bool:
         """
         Verify HMAC-SHA256 signature on webhook payload.
 
@@ -40,7 +83,8 @@ class WebhookValidator:
         - HTTP body contains: exact same bytes used for signature
 
         Args:
-            payload: Raw webhook payload bytes (from request.body)
+            payload: Raw webhook payload bytes (from request.body); any
+                     bytes-like buffer is accepted and hashed without copying
             signature_header: Value of X-Webhook-Signature header (format: "sha256=<hex>")
 
         Returns:
@@ -61,23 +105,67 @@ class WebhookValidator:
                 # Process webhook...
             ```
         """
-        # Compute expected signature using HMAC-SHA256
-        expected_signature = hmac.new(
-            self.webhook_secret.encode("utf-8"), payload, hashlib.sha256
-        ).hexdigest()
+        return self._matches(self._expected_signature(payload), signature_header)
 
-        # Extract signature from header (remove "sha256=" prefix if present)
-        received_signature = signature_header.replace("sha256=", "")
+    def verify_signature_bytes(
+        self, payload: bytes | bytearray | memoryview, signature_header: bytes
+    ) -> bool:
+        """
+        Verify HMAC-SHA256 signature when the header is available as raw bytes.
 
-        # Constant-time comparison to prevent timing attacks
-        return hmac.compare_digest(received_signature, expected_signature)
+        Same check as verify_signature(), for frameworks that expose raw header
+        bytes (e.g. Starlette's request.scope["headers"] or aiohttp's raw_headers),
+        so the header never has to be decoded to str.
 
-    def parse_webhook(self, payload: bytes, signature_header: str) -> dict[str, Any]:
+        Args:
+            payload: Raw webhook payload bytes
+            signature_header: Raw X-Webhook-Signature header value (format: b"sha256=<hex>")
+
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        return self._matches(self._expected_signature(payload), signature_header)
+
+    async def verify_signature_stream(
+        self, chunks: AsyncIterable[bytes], signature_header: str
+    ) -> bool:
+        """
+        Verify HMAC-SHA256 signature on a webhook body delivered in chunks.
+
+        Hashes the body incrementally instead of holding it in memory, which
+        keeps peak memory flat for large (e.g. bulk event) deliveries. The
+        stream is consumed, so use this when the body is not needed afterwards
+        or is processed from the same chunks elsewhere.
+
+        Args:
+            chunks: Async iterator of raw body chunks (e.g. Starlette's request.stream())
+            signature_header: Value of X-Webhook-Signature header (format: "sha256=<hex>")
+
+        Returns:
+            True if signature is valid, False otherwise
+
+        Example:
+            ```python
+            @app.post("/webhooks")
+            async def handle_webhook(request: Request):
+                signature = request.headers.get("X-Webhook-Signature", "")
+                if not await validator.verify_signature_stream(request.stream(), signature):
+                    raise HTTPException(status_code=401, detail="Invalid signature")
+            ```
+        """
+        h = self._hmac_template.copy()
+        async for chunk in chunks:
+            h.update(chunk)
+        return self._matches(h.digest(), signature_header)
+
+    def parse_webhook(
+        self, payload: bytes | bytearray | memoryview, signature_header: str
+    ) -> dict[str, Any]:
         """
         Parse and validate webhook in one step.
 
         Args:
-            payload: Raw webhook payload bytes
+            payload: Raw webhook payload bytes (bytes, bytearray or memoryview)
             signature_header: Value of X-Webhook-Signature header
 
         Returns:
@@ -103,7 +191,7 @@ class WebhookValidator:
         if not self.verify_signature(payload, signature_header):
             raise InvalidSignatureError("Webhook signature validation failed")
 
-        return json.loads(payload.decode("utf-8"))
+        return orjson.loads(payload)
 
     @staticmethod
     def generate_test_signature(webhook_secret: str, payload: dict[str, Any]) -> str:
@@ -137,10 +225,8 @@ class WebhookValidator:
             ```
         """
         # Match server's canonical JSON format exactly
-        payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        payload_json = _CANONICAL_JSON.encode(payload).encode("utf-8")
 
-        signature = hmac.new(
-            webhook_secret.encode("utf-8"), payload_json, hashlib.sha256
-        ).hexdigest()
+        signature = hmac.digest(webhook_secret.encode("utf-8"), payload_json, _DIGEST).hex()
 
         return f"sha256={signature}"